@@ -3,27 +3,14 @@
 A platform-agnostic library providing base abstractions for asset marketplace
 clients. Platforms (Fab, Unity Asset Store, etc.) extend these base classes
 with their specific implementations.
+
+Public names are resolved lazily on first access (PEP 562), so importing the
+package does not import every submodule up front.
 """
 
-from .auth import AsyncAuthProvider, AuthProvider, EndpointConfig
-from .client import AsyncMarketplaceClient, MarketplaceClient
-from .exceptions import (
-    MarketplaceAPIError,
-    MarketplaceAuthenticationError,
-    MarketplaceError,
-    MarketplaceNetworkError,
-    MarketplaceNotFoundError,
-    MarketplaceValidationError,
-)
-from .models import AsyncProgressCallback, ProgressCallback
-from .models.base import BaseAsset, BaseCollection
-from .models.result import DownloadResult
-from .utils import (
-    format_bytes,
-    safe_create_directory,
-    sanitize_filename,
-    validate_url,
-)
+from __future__ import annotations
+
+from ._lazy import attach
 
 __version__ = "0.2.0"
 
@@ -55,4 +42,40 @@ __all__ = [
     "validate_url",
     "safe_create_directory",
     "format_bytes",
+    "INVALID_FILENAME_CHARS",
+    # Lazy imports
+    "lazy_import",
 ]
+
+# Public name -> submodule it is loaded from on first access
+_LAZY: dict[str, str] = {
+    "AuthProvider": ".auth",
+    "EndpointConfig": ".auth",
+    "AsyncAuthProvider": ".auth",
+    "MarketplaceClient": ".client",
+    "AsyncMarketplaceClient": ".client",
+    "MarketplaceError": ".exceptions",
+    "MarketplaceAuthenticationError": ".exceptions",
+    "MarketplaceAPIError": ".exceptions",
+    "MarketplaceNotFoundError": ".exceptions",
+    "MarketplaceNetworkError": ".exceptions",
+    "MarketplaceValidationError": ".exceptions",
+    "BaseAsset": ".models.base",
+    "BaseCollection": ".models.base",
+    "ProgressCallback": ".models.progress",
+    "AsyncProgressCallback": ".models.progress",
+    "DownloadResult": ".models.result",
+    "sanitize_filename": ".utils",
+    "validate_url": ".utils",
+    "safe_create_directory": ".utils",
+    "format_bytes": ".utils",
+    "INVALID_FILENAME_CHARS": ".utils",
+    "lazy_import": "._lazy",
+}
+
+# Public submodules, imported on first attribute access so that
+# ``import asset_marketplace_core`` followed by ``asset_marketplace_core.utils``
+# keeps working without importing the package eagerly
+_SUBMODULES = frozenset({"auth", "client", "exceptions", "models", "utils"})
+
+__getattr__, __dir__ = attach(__name__, _LAZY, _SUBMODULES)
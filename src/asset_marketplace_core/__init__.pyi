@@ -0,0 +1,25 @@
+from ._lazy import lazy_import as lazy_import
+from .auth import AsyncAuthProvider as AsyncAuthProvider
+from .auth import AuthProvider as AuthProvider
+from .auth import EndpointConfig as EndpointConfig
+from .client import AsyncMarketplaceClient as AsyncMarketplaceClient
+from .client import MarketplaceClient as MarketplaceClient
+from .exceptions import MarketplaceAPIError as MarketplaceAPIError
+from .exceptions import MarketplaceAuthenticationError as MarketplaceAuthenticationError
+from .exceptions import MarketplaceError as MarketplaceError
+from .exceptions import MarketplaceNetworkError as MarketplaceNetworkError
+from .exceptions import MarketplaceNotFoundError as MarketplaceNotFoundError
+from .exceptions import MarketplaceValidationError as MarketplaceValidationError
+from .models import AsyncProgressCallback as AsyncProgressCallback
+from .models import ProgressCallback as ProgressCallback
+from .models.base import BaseAsset as BaseAsset
+from .models.base import BaseCollection as BaseCollection
+from .models.result import DownloadResult as DownloadResult
+from .utils import INVALID_FILENAME_CHARS as INVALID_FILENAME_CHARS
+from .utils import format_bytes as format_bytes
+from .utils import safe_create_directory as safe_create_directory
+from .utils import sanitize_filename as sanitize_filename
+from .utils import validate_url as validate_url
+
+__version__: str
+__all__: list[str]
@@ -0,0 +1,32 @@
+"""Compatibility shims for the range of supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+__all__ = ["DATACLASS_SLOTS", "INTERN_IS_MORTAL", "Protocol", "runtime_checkable"]
+
+# Slotted dataclasses need weakref_slot (3.11+) to stay weak-referenceable,
+# so older interpreters keep regular __dict__-backed instances: a
+# hand-written __slots__ cannot be combined with dataclass field defaults,
+# which are stored as class attributes.
+DATACLASS_SLOTS: dict[str, Any]
+if sys.version_info >= (3, 11):
+    DATACLASS_SLOTS = {"slots": True, "weakref_slot": True}
+else:
+    DATACLASS_SLOTS = {}
+
+# CPython 3.12 makes every sys.intern()ed string immortal, so interning
+# unbounded input (such as asset uids) leaks it for the life of the process.
+# 3.13 made interned strings mortal again.
+INTERN_IS_MORTAL = sys.version_info[:2] != (3, 12)
+
+if sys.version_info >= (3, 8):
+    from typing import Protocol, runtime_checkable
+else:  # pragma: no cover
+    # typing.Protocol arrived in 3.8; on 3.7 callbacks stay nominal base classes
+    from abc import ABC as Protocol
+
+    def runtime_checkable(cls: Any) -> Any:
+        return cls
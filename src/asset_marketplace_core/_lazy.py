@@ -0,0 +1,196 @@
+"""Deferred imports for heavy optional dependencies and for this package.
+
+Platform clients typically depend on HTTP libraries (aiohttp, httpx,
+requests) whose import cost dominates start-up. ``lazy_import`` returns a
+placeholder immediately and performs the real import on first use.
+
+``attach`` builds the PEP 562 hooks that the package and its subpackages
+use to load their own exports on first access.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Mapping
+
+_UNRESOLVED = object()
+
+_FORWARDED_CLASS_ATTRS = frozenset({"__doc__", "__module__"})
+_UNFORWARDED_ATTRS = frozenset(
+    {
+        "_name",
+        "_target",
+        "__copy__",
+        "__deepcopy__",
+        "__getnewargs__",
+        "__getnewargs_ex__",
+        "__getstate__",
+        "__reduce__",
+        "__reduce_ex__",
+        "__setstate__",
+    }
+)
+
+
+class _LazyAttribute:
+    """Placeholder for a dotted name such as ``"aiohttp.ClientSession"``.
+
+    The name is resolved on first attribute access or call, either as a
+    submodule or as an attribute of its parent module.
+    """
+
+    __slots__ = ("_name", "_target")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._target: Any = _UNRESOLVED
+
+    def _resolve(self) -> Any:
+        target = self._target
+        if target is _UNRESOLVED:
+            name = self._name
+            try:
+                target = importlib.import_module(name)
+            except ModuleNotFoundError as e:
+                if e.name != name:
+                    raise
+                module_name, _, attr = name.rpartition(".")
+                try:
+                    target = getattr(importlib.import_module(module_name), attr)
+                except AttributeError:
+                    raise ImportError(
+                        f"cannot import name {attr!r} from {module_name!r}",
+                        name=module_name,
+                    ) from None
+            self._target = target
+        return target
+
+    def __getattribute__(self, name: str) -> Any:
+        # The class defines these itself, so __getattr__ would never see them
+        if name in _FORWARDED_CLASS_ATTRS:
+            return getattr(object.__getattribute__(self, "_resolve")(), name)
+        return object.__getattribute__(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        # copy and pickle probe these (and our own slots before they are
+        # set); resolving for them would recurse or copy the target instead
+        if name in _UNFORWARDED_ATTRS:
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __reduce__(self) -> tuple[type[_LazyAttribute], tuple[str]]:
+        # Recreate from the name; the _UNRESOLVED sentinel does not survive
+        # pickling
+        return (_LazyAttribute, (self._name,))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "unresolved" if self._target is _UNRESOLVED else "resolved"
+        return f"<lazy {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """Import a module, or a dotted attribute, only when it is first used.
+
+    Top-level module names return a module object whose code runs on first
+    attribute access (via ``importlib.util.LazyLoader``). Dotted names return
+    a proxy that resolves to the submodule or attribute on first use, so not
+    even the parent package is imported up front.
+
+    Args:
+        name: Module name (``"aiohttp"``) or dotted path to a submodule or
+            attribute (``"aiohttp.ClientSession"``)
+
+    Returns:
+        The lazily loaded module, or a proxy for the dotted name
+
+    Raises:
+        ModuleNotFoundError: If the top-level package cannot be found
+
+    Examples:
+        >>> aiohttp = lazy_import("aiohttp")
+        >>> sqrt = lazy_import("math.sqrt")
+        >>> sqrt(9.0)
+        3.0
+    """
+    # Imported here so that attach(), which every package __init__ uses,
+    # does not pull in importlib.util
+    import importlib.util
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    top_level, dot, _ = name.partition(".")
+    if dot:
+        if top_level not in sys.modules and importlib.util.find_spec(top_level) is None:
+            raise ModuleNotFoundError(f"No module named {top_level!r}", name=top_level)
+        return _LazyAttribute(name)
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    if spec.loader is None:
+        # Namespace packages have no code to defer, so import them directly
+        return importlib.import_module(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def attach(
+    package_name: str,
+    attrs: Mapping[str, str],
+    submodules: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for a lazy package.
+
+    Public names are imported from their submodule on first access and
+    cached in the package globals, so later lookups never reach
+    ``__getattr__``. Submodules are imported on first attribute access.
+
+    Args:
+        package_name: ``__name__`` of the package being initialised
+        attrs: Public name -> submodule it is loaded from, relative to the
+            package (``".sync"``)
+        submodules: Names of submodules reachable as package attributes
+
+    Returns:
+        ``(__getattr__, __dir__)`` to bind at module level
+
+    Examples:
+        >>> __getattr__, __dir__ = attach(__name__, {"MarketplaceClient": ".sync"})
+    """
+    package_globals = sys.modules[package_name].__dict__
+    submodule_names = frozenset(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in submodule_names:
+            # The import system binds the submodule in the package globals
+            return importlib.import_module(f"{package_name}.{name}")
+
+        try:
+            module_name = attrs[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            ) from None
+
+        value = getattr(importlib.import_module(module_name, package_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(package_globals) | set(attrs) | submodule_names)
+
+    return __getattr__, __dir__
@@ -1,6 +1,8 @@
 """Authentication and endpoint configuration abstractions."""
 
-from .async_ import AsyncAuthProvider
+from __future__ import annotations
+
+from .._lazy import attach
 from .sync import AuthProvider, EndpointConfig
 
 __all__ = [
@@ -8,3 +10,11 @@ __all__ = [
     "EndpointConfig",
     "AsyncAuthProvider",
 ]
+
+_LAZY: dict[str, str] = {
+    "AsyncAuthProvider": ".async_",
+}
+
+_SUBMODULES = frozenset({"sync", "async_"})
+
+__getattr__, __dir__ = attach(__name__, _LAZY, _SUBMODULES)
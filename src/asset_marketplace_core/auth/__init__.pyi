@@ -0,0 +1,5 @@
+from .async_ import AsyncAuthProvider as AsyncAuthProvider
+from .sync import AuthProvider as AuthProvider
+from .sync import EndpointConfig as EndpointConfig
+
+__all__: list[str]
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING
 
-from .sync import EndpointConfig
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .sync import EndpointConfig
 
 
 class AsyncAuthProvider(ABC):
@@ -19,7 +22,12 @@ class AsyncAuthProvider(ABC):
     Platform implementations will typically return an aiohttp.ClientSession,
     httpx.AsyncClient, or similar async HTTP client object.
 
+    Full method contracts (arguments, return values, errors) are in
+    docs/api_reference.md.
+
     Example:
+        >>> from asset_marketplace_core import lazy_import
+        >>> aiohttp = lazy_import("aiohttp")  # imported on first use
         >>> class MyAsyncAuth(AsyncAuthProvider):
         ...     def __init__(self, api_key: str):
         ...         self.api_key = api_key
@@ -27,7 +35,6 @@ class AsyncAuthProvider(ABC):
         ...
         ...     async def get_session(self):
         ...         if self._session is None:
-        ...             import aiohttp
         ...             self._session = aiohttp.ClientSession(
         ...                 headers={'Authorization': f'Bearer {self.api_key}'}
         ...             )
@@ -43,30 +50,12 @@ class AsyncAuthProvider(ABC):
 
     @abstractmethod
     async def get_session(self) -> Any:
-        """Get configured async session/client for making authenticated requests.
-
-        Returns:
-            Configured async session object (e.g., aiohttp.ClientSession,
-            httpx.AsyncClient)
-
-        Note:
-            The return type is intentionally Any to avoid dependencies.
-            Platform implementations should document their specific return type.
-
-        Raises:
-            MarketplaceAuthenticationError: If authentication setup fails
-        """
+        """Get configured async session/client for making authenticated requests."""
         pass
 
     @abstractmethod
     def get_endpoints(self) -> EndpointConfig:
-        """Get API endpoint configuration.
-
-        Note: Synchronous method - endpoint config doesn't require async.
-
-        Returns:
-            EndpointConfig instance (or platform-specific subclass)
-        """
+        """Get API endpoint configuration (synchronous, no I/O needed)."""
         pass
 
     async def refresh(self) -> None:
@@ -1,11 +1,18 @@
 """Authentication and endpoint configuration abstractions."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING
+
+from .._compat import DATACLASS_SLOTS
+
+if TYPE_CHECKING:
+    from typing import Any
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EndpointConfig:
     """Base configuration for API endpoints.
 
@@ -36,28 +43,19 @@ class AuthProvider(ABC):
 
     Platform implementations will typically return a requests.Session,
     httpx.Client, or similar HTTP client object.
+
+    Full method contracts (arguments, return values, errors) are in
+    docs/api_reference.md.
     """
 
     @abstractmethod
     def get_session(self) -> Any:
-        """Get configured session/client for making authenticated requests.
-
-        Returns:
-            Configured session object (e.g., requests.Session, httpx.Client)
-
-        Note:
-            The return type is intentionally Any to avoid dependencies.
-            Platform implementations should document their specific return type.
-        """
+        """Get configured session/client for making authenticated requests."""
         pass
 
     @abstractmethod
     def get_endpoints(self) -> EndpointConfig:
-        """Get API endpoint configuration.
-
-        Returns:
-            EndpointConfig instance (or platform-specific subclass)
-        """
+        """Get API endpoint configuration."""
         pass
 
     def refresh(self) -> None:
@@ -1,9 +1,21 @@
 """Client abstractions for marketplace operations."""
 
-from .async_ import AsyncMarketplaceClient
-from .sync import MarketplaceClient
+from __future__ import annotations
+
+from .._lazy import attach
 
 __all__ = [
     "MarketplaceClient",
     "AsyncMarketplaceClient",
 ]
+
+# Loaded per name, so sync-only consumers never import the async client
+# (and vice versa)
+_LAZY: dict[str, str] = {
+    "MarketplaceClient": ".sync",
+    "AsyncMarketplaceClient": ".async_",
+}
+
+_SUBMODULES = frozenset({"sync", "async_"})
+
+__getattr__, __dir__ = attach(__name__, _LAZY, _SUBMODULES)
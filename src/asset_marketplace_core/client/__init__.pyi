@@ -0,0 +1,4 @@
+from .async_ import AsyncMarketplaceClient as AsyncMarketplaceClient
+from .sync import MarketplaceClient as MarketplaceClient
+
+__all__: list[str]
@@ -1,15 +1,55 @@
 """Marketplace client abstract base class."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Optional, Union
+
+    from ..models.base import BaseAsset, BaseCollection
+    from ..models.progress import ProgressCallback
+    from ..models.result import DownloadResult
 
-from ..models.base import BaseAsset, BaseCollection
-from ..models.result import DownloadResult
-from ..models.sync_progress import ProgressCallback
+_SyncContextT = TypeVar("_SyncContextT", bound="_SyncContextMixin")
 
 
-class MarketplaceClient(ABC):
+class _SyncContextMixin:
+    """Context manager that calls ``close()`` on exit.
+
+    Kept separate from MarketplaceClient so composite or wrapper clients can
+    reuse the ``with`` behaviour without taking on the abstract API surface.
+    """
+
+    __slots__ = ()
+
+    close: Callable[[], None]
+
+    def __enter__(self: _SyncContextT) -> _SyncContextT:
+        """Enter context manager.
+
+        Returns:
+            Self for use in with statement
+        """
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit context manager and clean up resources.
+
+        Args:
+            exc_type: Exception type if an error occurred
+            exc_val: Exception value if an error occurred
+            exc_tb: Exception traceback if an error occurred
+        """
+        # Looked up at exit rather than bound in __enter__: caching the bound
+        # method costs an extra attribute store, creates a self-reference
+        # cycle, and would miss a close() patched while the block runs.
+        self.close()
+
+
+class MarketplaceClient(_SyncContextMixin, ABC):
     """Abstract base class for marketplace API clients.
 
     Platform-specific implementations extend this class to provide
@@ -17,6 +57,9 @@ class MarketplaceClient(ABC):
 
     Supports context manager protocol for automatic resource cleanup.
 
+    Full method contracts (arguments, return values, errors) are in
+    docs/api_reference.md.
+
     Example:
         >>> class MyMarketplaceClient(MarketplaceClient):
         ...     def __init__(self, auth: MyAuthProvider):
@@ -37,36 +80,12 @@ class MarketplaceClient(ABC):
 
     @abstractmethod
     def get_collection(self, **kwargs: Any) -> BaseCollection:
-        """Retrieve a collection of assets.
-
-        Platform implementations define their own query parameters
-        (e.g., limit, offset, search, category).
-
-        Args:
-            **kwargs: Platform-specific query parameters
-
-        Returns:
-            Collection of assets
-
-        Raises:
-            MarketplaceError: If collection retrieval fails
-        """
+        """Retrieve a collection of assets."""
         pass
 
     @abstractmethod
     def get_asset(self, asset_uid: str) -> BaseAsset:
-        """Retrieve a specific asset by unique identifier.
-
-        Args:
-            asset_uid: Unique identifier for the asset
-
-        Returns:
-            Asset details
-
-        Raises:
-            MarketplaceNotFoundError: If asset doesn't exist
-            MarketplaceError: If asset retrieval fails
-        """
+        """Retrieve a specific asset by unique identifier."""
         pass
 
     @abstractmethod
@@ -77,49 +96,10 @@ class MarketplaceClient(ABC):
         progress_callback: Optional[ProgressCallback] = None,
         **kwargs: Any,
     ) -> DownloadResult:
-        """Download an asset to the specified directory.
-
-        Args:
-            asset_uid: Unique identifier for the asset to download
-            output_dir: Directory where asset files should be saved
-            progress_callback: Optional callback for progress updates
-            **kwargs: Platform-specific download parameters
-
-        Returns:
-            DownloadResult with details of the operation
-
-        Raises:
-            MarketplaceNotFoundError: If asset doesn't exist
-            MarketplaceValidationError: If output_dir is invalid
-            MarketplaceError: If download fails
-        """
+        """Download an asset to the specified directory."""
         pass
 
     @abstractmethod
     def close(self) -> None:
-        """Close the client and clean up resources.
-
-        Should be called when done with the client to ensure proper
-        cleanup of network connections, file handles, etc.
-
-        When using the context manager, this is called automatically.
-        """
+        """Close the client and clean up resources."""
         pass
-
-    def __enter__(self) -> "MarketplaceClient":
-        """Enter context manager.
-
-        Returns:
-            Self for use in with statement
-        """
-        return self
-
-    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit context manager and clean up resources.
-
-        Args:
-            exc_type: Exception type if an error occurred
-            exc_val: Exception value if an error occurred
-            exc_tb: Exception traceback if an error occurred
-        """
-        self.close()
@@ -8,64 +8,62 @@ class MarketplaceError(Exception):
     to create their own exception hierarchies.
     """
 
-    pass
 
-
-class MarketplaceAuthenticationError(MarketplaceError):
-    """Raised when authentication fails or credentials are invalid.
-
-    Examples:
-        - Invalid or expired authentication tokens
-        - Missing required credentials
-        - Authentication service unavailable
-    """
-
-    pass
-
-
-class MarketplaceAPIError(MarketplaceError):
-    """Raised when the API returns an error response.
-
-    Examples:
-        - 4xx client errors (bad request, not authorized, etc.)
-        - 5xx server errors
-        - Unexpected API response format
-    """
-
-    pass
-
-
-class MarketplaceNotFoundError(MarketplaceError):
-    """Raised when a requested resource is not found.
-
-    Examples:
-        - Asset UID does not exist
-        - Collection not found
-        - Endpoint returns 404
-    """
-
-    pass
-
-
-class MarketplaceNetworkError(MarketplaceError):
-    """Raised when a network-level error occurs.
-
-    Examples:
-        - Connection timeout
-        - DNS resolution failure
-        - Network unreachable
-    """
-
-    pass
-
-
-class MarketplaceValidationError(MarketplaceError):
-    """Raised when input validation fails.
-
-    Examples:
-        - Invalid asset UID format
-        - Invalid file path
-        - Missing required parameters
-    """
-
-    pass
+# Leaf exceptions carry no behaviour of their own, so they are created from
+# this table in one pass; exceptions.pyi declares them for type checkers.
+# Adding a new leaf exception is a one-entry change here plus the stub.
+_LEAF_EXCEPTIONS = {
+    "MarketplaceAuthenticationError": (
+        """Raised when authentication fails or credentials are invalid.
+
+        Examples:
+            - Invalid or expired authentication tokens
+            - Missing required credentials
+            - Authentication service unavailable
+        """
+    ),
+    "MarketplaceAPIError": (
+        """Raised when the API returns an error response.
+
+        Examples:
+            - 4xx client errors (bad request, not authorized, etc.)
+            - 5xx server errors
+            - Unexpected API response format
+        """
+    ),
+    "MarketplaceNotFoundError": (
+        """Raised when a requested resource is not found.
+
+        Examples:
+            - Asset UID does not exist
+            - Collection not found
+            - Endpoint returns 404
+        """
+    ),
+    "MarketplaceNetworkError": (
+        """Raised when a network-level error occurs.
+
+        Examples:
+            - Connection timeout
+            - DNS resolution failure
+            - Network unreachable
+        """
+    ),
+    "MarketplaceValidationError": (
+        """Raised when input validation fails.
+
+        Examples:
+            - Invalid asset UID format
+            - Invalid file path
+            - Missing required parameters
+        """
+    ),
+}
+
+for _name, _doc in _LEAF_EXCEPTIONS.items():
+    globals()[_name] = type(
+        _name, (MarketplaceError,), {"__doc__": _doc, "__module__": __name__}
+    )
+del _name, _doc
+
+__all__ = ["MarketplaceError", *_LEAF_EXCEPTIONS]
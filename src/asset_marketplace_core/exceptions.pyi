@@ -0,0 +1,8 @@
+__all__: list[str]
+
+class MarketplaceError(Exception): ...
+class MarketplaceAuthenticationError(MarketplaceError): ...
+class MarketplaceAPIError(MarketplaceError): ...
+class MarketplaceNotFoundError(MarketplaceError): ...
+class MarketplaceNetworkError(MarketplaceError): ...
+class MarketplaceValidationError(MarketplaceError): ...
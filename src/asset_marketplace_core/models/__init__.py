@@ -1,9 +1,8 @@
 """Data models for asset marketplace operations."""
 
-from .async_progress import AsyncProgressCallback
-from .base import BaseAsset, BaseCollection
-from .result import DownloadResult
-from .sync_progress import ProgressCallback
+from __future__ import annotations
+
+from .._lazy import attach
 
 __all__ = [
     "BaseAsset",
@@ -12,3 +11,17 @@ __all__ = [
     "AsyncProgressCallback",
     "DownloadResult",
 ]
+
+_LAZY: dict[str, str] = {
+    "BaseAsset": ".base",
+    "BaseCollection": ".base",
+    "ProgressCallback": ".progress",
+    "AsyncProgressCallback": ".progress",
+    "DownloadResult": ".result",
+}
+
+_SUBMODULES = frozenset(
+    {"base", "progress", "result", "sync_progress", "async_progress"}
+)
+
+__getattr__, __dir__ = attach(__name__, _LAZY, _SUBMODULES)
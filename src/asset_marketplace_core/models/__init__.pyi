@@ -0,0 +1,7 @@
+from .base import BaseAsset as BaseAsset
+from .base import BaseCollection as BaseCollection
+from .progress import AsyncProgressCallback as AsyncProgressCallback
+from .progress import ProgressCallback as ProgressCallback
+from .result import DownloadResult as DownloadResult
+
+__all__: list[str]
@@ -1,17 +1,39 @@
 """Base data models for assets and collections."""
 
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .._compat import DATACLASS_SLOTS, INTERN_IS_MORTAL
 
+if TYPE_CHECKING:
+    from typing import Callable
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class BaseAsset:
     """Base representation of a marketplace asset.
 
     Platform-specific implementations should extend this class to add
     their own fields (e.g., publisher, category, price, dependencies).
 
+    On Python 3.11+ instances use ``__slots__`` instead of a per-instance
+    ``__dict__``. Subclasses keep that saving only if they are declared
+    with ``@dataclass(slots=True)`` as well; otherwise they simply gain a
+    ``__dict__`` for their own fields.
+
+    ``uid`` is interned on construction, so assets that recur across
+    paginated responses share one string. This is skipped on Python 3.12,
+    where interned strings are never freed.
+
+    Subclasses that define their own ``__post_init__`` should call
+    ``BaseAsset.__post_init__(self)``. Zero-argument ``super()`` fails in
+    ``@dataclass(slots=True)`` subclasses before Python 3.14, because the
+    decorator replaces the class.
+
     Attributes:
         uid: Unique identifier for the asset
         title: Human-readable name of the asset
@@ -28,15 +50,44 @@ class BaseAsset:
     updated_at: Optional[datetime] = None
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Intern the uid to deduplicate it and speed up index lookups."""
+        # sys.intern rejects str subclasses; leave anything else untouched
+        if INTERN_IS_MORTAL and type(self.uid) is str:
+            self.uid = sys.intern(self.uid)
+
+
+class _UidIndexSlot:
+    """Storage for BaseCollection's uid index outside the dataclass fields.
 
-@dataclass
-class BaseCollection:
+    Keeping the cache off the field list keeps it out of ``fields()``,
+    ``asdict()``, ``astuple()``, ``repr()`` and ``==``. It lives on a base
+    class because ``dataclass(slots=True)`` rejects a class that already
+    declares ``__slots__``.
+    """
+
+    __slots__ = ("_uid_index",)
+
+    # (assets list it was built from, its length at the time, uid -> asset)
+    _uid_index: Optional[Tuple[List[BaseAsset], int, Dict[str, BaseAsset]]]
+
+
+@dataclass(**DATACLASS_SLOTS)
+class BaseCollection(_UidIndexSlot):
     """Base collection of marketplace assets.
 
     Platform-specific implementations should extend this class to add
     their own filtering and sorting methods (e.g., filter_by_category,
     sort_by_price).
 
+    To apply several predicates, prefer a single filter_many() call over
+    chained filter() calls; it scans the assets once and builds one list.
+
+    Lookups via find_by_uid() are served from a uid index built on first
+    use. The index is rebuilt automatically when ``assets`` is rebound or
+    changes length; code that replaces items in place without changing the
+    length (``assets[i] = other``) must call invalidate_index() afterwards.
+
     Attributes:
         assets: List of assets in the collection
         total_count: Total number of assets (may differ from len(assets)
@@ -54,7 +105,15 @@ class BaseCollection:
         """
         return len(self.assets)
 
-    def filter(self, predicate: Callable[[BaseAsset], bool]) -> "BaseCollection":
+    def __bool__(self) -> bool:
+        """Check whether the collection holds any assets.
+
+        Returns:
+            True if there is at least one asset
+        """
+        return bool(self.assets)
+
+    def filter(self, predicate: Callable[[BaseAsset], bool]) -> BaseCollection:
         """Filter assets by predicate function.
 
         Args:
@@ -67,7 +126,32 @@ class BaseCollection:
             >>> collection.filter(lambda a: a.title.startswith("Epic"))
             >>> collection.filter(lambda a: a.created_at > some_date)
         """
-        filtered_assets = [asset for asset in self.assets if predicate(asset)]
+        filtered_assets = list(filter(predicate, self.assets))
+        return BaseCollection(assets=filtered_assets, total_count=len(filtered_assets))
+
+    def filter_many(self, *predicates: Callable[[BaseAsset], bool]) -> BaseCollection:
+        """Filter assets by several predicates in a single pass.
+
+        Equivalent to chaining filter() once per predicate, but evaluates
+        all predicates per asset and allocates only one result list.
+        Predicates are short-circuited in the order given.
+
+        Args:
+            *predicates: Functions that take an asset and return True to
+                include it; an asset is kept only if all of them do
+
+        Returns:
+            New collection with filtered assets
+
+        Examples:
+            >>> collection.filter_many(
+            ...     lambda a: a.title.startswith("Epic"),
+            ...     lambda a: a.created_at is not None,
+            ... )
+        """
+        filtered_assets = [
+            asset for asset in self.assets if all(p(asset) for p in predicates)
+        ]
         return BaseCollection(assets=filtered_assets, total_count=len(filtered_assets))
 
     def find_by_uid(self, uid: str) -> Optional[BaseAsset]:
@@ -84,7 +168,25 @@ class BaseCollection:
             >>> if asset:
             ...     print(asset.title)
         """
-        for asset in self.assets:
-            if asset.uid == uid:
-                return asset
-        return None
+        assets = self.assets
+        # The slot is unset until the first lookup
+        cached = getattr(self, "_uid_index", None)
+        # Holding the list itself (not its id()) rules out a recycled id
+        # matching a different list
+        if cached is None or cached[0] is not assets or cached[1] != len(assets):
+            # Built from the reversed list so the first asset wins on duplicate
+            # uids, matching the behaviour of a linear scan
+            index = {asset.uid: asset for asset in reversed(assets)}
+            cached = (assets, len(assets), index)
+            object.__setattr__(self, "_uid_index", cached)
+        return cached[2].get(uid)
+
+    def invalidate_index(self) -> None:
+        """Discard the cached uid index used by find_by_uid().
+
+        Call this after replacing assets in place without changing the
+        length of ``assets``; the index is rebuilt on the next lookup.
+        Rebinding ``assets`` or adding and removing assets is detected
+        automatically.
+        """
+        object.__setattr__(self, "_uid_index", None)
@@ -0,0 +1,101 @@
+"""Progress callback protocols for long-running operations."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._compat import Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+
+@runtime_checkable
+class ProgressCallback(Protocol):
+    """Protocol for progress callbacks during operations like downloads.
+
+    Platform implementations can provide concrete implementations for
+    progress reporting (e.g., CLI progress bars, GUI progress indicators).
+    Any object with matching methods satisfies the protocol; subclassing
+    ProgressCallback is optional.
+
+    Full method contracts (arguments, return values, errors) are in
+    docs/api_reference.md.
+
+    Example:
+        >>> class ConsoleProgress(ProgressCallback):
+        ...     def on_start(self, total: Optional[int]) -> None:
+        ...         print(f"Starting download ({total} bytes)")
+        ...
+        ...     def on_progress(self, current: int, total: Optional[int]) -> None:
+        ...         if total:
+        ...             percent = (current / total) * 100
+        ...             print(f"Progress: {percent:.1f}%")
+        ...
+        ...     def on_complete(self) -> None:
+        ...         print("Download complete!")
+        ...
+        ...     def on_error(self, error: Exception) -> None:
+        ...         print(f"Error: {error}")
+    """
+
+    def on_start(self, total: Optional[int]) -> None:
+        """Called when an operation starts."""
+
+    def on_progress(self, current: int, total: Optional[int]) -> None:
+        """Called periodically during operation to report progress."""
+
+    def on_complete(self) -> None:
+        """Called when operation completes successfully."""
+
+    def on_error(self, error: Exception) -> None:
+        """Called when operation encounters an error."""
+
+
+@runtime_checkable
+class AsyncProgressCallback(Protocol):
+    """Protocol for async progress callbacks during operations.
+
+    Platform implementations can provide concrete implementations for
+    async progress reporting (e.g., async CLI, async GUI indicators).
+    Any object with matching coroutine methods satisfies the protocol;
+    subclassing AsyncProgressCallback is optional.
+
+    Full method contracts (arguments, return values, errors) are in
+    docs/api_reference.md.
+
+    Example:
+        >>> class AsyncConsoleProgress(AsyncProgressCallback):
+        ...     async def on_start(self, total: Optional[int]) -> None:
+        ...         print(f"Starting download ({total} bytes)")
+        ...
+        ...     async def on_progress(self, current: int, total: Optional[int]) -> None:
+        ...         if total:
+        ...             percent = (current / total) * 100
+        ...             print(f"Progress: {percent:.1f}%")
+        ...
+        ...     async def on_complete(self) -> None:
+        ...         print("Download complete!")
+        ...
+        ...     async def on_error(self, error: Exception) -> None:
+        ...         print(f"Error: {error}")
+
+        >>> async with MyAsyncClient(auth) as client:
+        ...     result = await client.download_asset(
+        ...         "asset-123",
+        ...         "./downloads",
+        ...         progress_callback=AsyncConsoleProgress()
+        ...     )
+    """
+
+    async def on_start(self, total: Optional[int]) -> None:
+        """Called when an operation starts."""
+
+    async def on_progress(self, current: int, total: Optional[int]) -> None:
+        """Called periodically during operation to report progress."""
+
+    async def on_complete(self) -> None:
+        """Called when operation completes successfully."""
+
+    async def on_error(self, error: Exception) -> None:
+        """Called when operation encounters an error."""
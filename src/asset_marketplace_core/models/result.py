@@ -1,10 +1,16 @@
 """Result models for marketplace operations."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypeVar
+
+from .._compat import DATACLASS_SLOTS
+
+_DownloadResultT = TypeVar("_DownloadResultT", bound="DownloadResult")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DownloadResult:
     """Result of a download operation.
 
@@ -34,6 +40,10 @@ class DownloadResult:
         ...     files=[],
         ...     error="Network timeout"
         ... )
+
+        >>> # Shorthand constructors for the common shapes
+        >>> result = DownloadResult.ok("12345", ["/downloads/asset.zip"])
+        >>> result = DownloadResult.fail("12345", "Network timeout")
     """
 
     success: bool
@@ -41,3 +51,62 @@ class DownloadResult:
     files: List[str] = field(default_factory=list)
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def ok(
+        cls: type[_DownloadResultT],
+        asset_uid: str,
+        files: list[str],
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> _DownloadResultT:
+        """Create a successful result.
+
+        For DownloadResult itself the instance is populated directly,
+        bypassing the generated ``__init__`` and its default factories.
+        Subclasses are constructed normally so their own fields and
+        ``__post_init__`` are honoured.
+
+        Args:
+            asset_uid: Unique identifier of the downloaded asset
+            files: Paths of the downloaded files (stored, not copied)
+            metadata: Optional platform-specific metadata
+
+        Returns:
+            Result with ``success=True`` and no error
+        """
+        if metadata is None:
+            metadata = {}
+        if cls is not DownloadResult:
+            return cls(
+                success=True, asset_uid=asset_uid, files=files, metadata=metadata
+            )
+        self = cls.__new__(cls)
+        self.success = True
+        self.asset_uid = asset_uid
+        self.files = files
+        self.error = None
+        self.metadata = metadata
+        return self
+
+    @classmethod
+    def fail(
+        cls: type[_DownloadResultT], asset_uid: str, error: str
+    ) -> _DownloadResultT:
+        """Create a failed result with no files or metadata.
+
+        Args:
+            asset_uid: Unique identifier of the asset that failed
+            error: Human-readable error message
+
+        Returns:
+            Result with ``success=False`` and the given error
+        """
+        if cls is not DownloadResult:
+            return cls(success=False, asset_uid=asset_uid, error=error)
+        self = cls.__new__(cls)
+        self.success = False
+        self.asset_uid = asset_uid
+        self.files = []
+        self.error = error
+        self.metadata = {}
+        return self
@@ -1,18 +1,66 @@
 """Utility functions for asset marketplace operations."""
 
+from __future__ import annotations
+
+import math
+import os
 import re
-from pathlib import Path
-from typing import Union
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from .exceptions import MarketplaceValidationError
 
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Union
+
+# Characters not allowed in filenames on Windows (/ is also invalid on Unix)
+INVALID_FILENAME_CHARS: frozenset[str] = frozenset('/\\:*?"<>|')
+
+# Deletion table for str.translate, derived from the same set
+_INVALID_TABLE = str.maketrans(dict.fromkeys(INVALID_FILENAME_CHARS))
+
+# Leading/trailing characters stripped from filenames
+_STRIP_CHARS = ". "
+
+# Byte units, each 1024 times the previous one
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_MAX_UNIT_INDEX = len(_UNITS) - 1
+
+# C0 control characters and space, stripped from both ends of a URL as
+# urllib.parse.urlsplit does (it only strips the front)
+_URL_STRIP_CHARS = "".join(map(chr, range(0x21)))
+
+# http(s) scheme followed by a non-empty network location that runs up to the
+# first / ? # (as urlsplit splits it), with no whitespace or control characters.
+# A bracketed host must be the whole host: only userinfo may precede it and
+# only a numeric port may follow. The network location and the bracketed host
+# are captured for the NFKC and IPv6 checks
+_URL_RE = re.compile(
+    r"https?://(?=[^/?#])"
+    r"(?P<netloc>"
+    r"(?:[^/?#\x00-\x20\[\]]*@)?\[(?P<host>[^/?#\x00-\x20\[\]]+)\]"
+    r"(?::[0-9]*)?"
+    r"|[^/?#\x00-\x20\[\]]*"
+    r")"
+    r"(?:[/?#]|\Z)",
+    re.IGNORECASE,
+)
+
+# Characters that must not appear when a netloc is NFKC-normalized
+_NETLOC_DELIMITERS = "/?#@:"
+_NETLOC_DELIMITER_TABLE = str.maketrans("", "", "@:#?")
+_IPV_FUTURE_RE = re.compile(r"v[0-9a-f]+\..+", re.IGNORECASE)
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename by removing or replacing invalid characters.
 
     Removes characters that are not allowed in filenames on most filesystems,
-    including: / \\ : * ? " < > |
+    including: / \\ : * ? " < > | (see ``INVALID_FILENAME_CHARS``)
+
+    Results are memoized, since the same asset titles tend to be sanitized
+    again across retries and re-downloads.
 
     Args:
         filename: The filename to sanitize
@@ -29,16 +77,19 @@ def sanitize_filename(filename: str) -> str:
         >>> sanitize_filename("file/with\\\\invalid:chars")
         'filewithinvalidchars'
     """
+    return _sanitize_filename(filename)
+
+
+# Kept private so the public function keeps its signature for type checkers;
+# lru_cache's wrapper type accepts any hashable arguments
+@lru_cache(maxsize=4096)
+def _sanitize_filename(filename: str) -> str:
+    """Memoized implementation of sanitize_filename()."""
     if not filename:
         raise MarketplaceValidationError("Filename cannot be empty")
 
-    # Remove or replace invalid characters
-    # Windows: / \\ : * ? " < > |
-    # Unix: /
-    sanitized = re.sub(r'[/\\:*?"<>|]', "", filename)
-
-    # Remove leading/trailing whitespace and dots
-    sanitized = sanitized.strip(". ")
+    # Drop invalid characters, then leading/trailing whitespace and dots
+    sanitized = filename.translate(_INVALID_TABLE).strip(_STRIP_CHARS)
 
     if not sanitized:
         raise MarketplaceValidationError(
@@ -52,6 +103,11 @@ def validate_url(url: str) -> bool:
     """Validate that a string is a well-formed URL.
 
     Checks that the URL has a valid scheme (http/https) and network location.
+    Surrounding whitespace and control characters (such as a trailing newline
+    read from a config file) are ignored; inside the network location they
+    make the URL invalid. Values that are not ``str`` are invalid. Results are
+    memoized, since clients tend to validate the same handful of configured
+    endpoints repeatedly.
 
     Args:
         url: The URL to validate
@@ -67,30 +123,67 @@ def validate_url(url: str) -> bool:
         >>> validate_url("ftp://example.com")
         False
     """
-    if not url:
+    # Checked before the cache: unhashable input must not reach lru_cache
+    if not isinstance(url, str):
         return False
+    return _validate_url(url)
+
+
+@lru_cache(maxsize=1024)
+def _validate_url(url: str) -> bool:
+    """Memoized implementation of validate_url()."""
+    match = _URL_RE.match(url.strip(_URL_STRIP_CHARS))
+    if match is None:
+        return False
+
+    netloc = match.group("netloc")
+    if not netloc.isascii() and not _is_nfkc_safe_netloc(netloc):
+        return False
+
+    bracketed_host = match.group("host")
+    return bracketed_host is None or _is_bracketed_host(bracketed_host)
+
+
+def _is_nfkc_safe_netloc(netloc: str) -> bool:
+    """Reject netlocs that NFKC normalization turns into URL delimiters.
+
+    IDNA hosts are compared under NFKC, so "evil.com＃@good.com" or
+    "ex℀ample.com" would resolve somewhere other than they appear to.
+    Mirrors the CVE-2019-9636 guard in ``urllib.parse._checknetloc``.
+    """
+    # Non-ASCII netlocs are rare; keep unicodedata off the import path
+    import unicodedata
+
+    # Delimiters already present are ignored, as urlsplit does
+    stripped = netloc.translate(_NETLOC_DELIMITER_TABLE)
+    normalized = unicodedata.normalize("NFKC", stripped)
+    return normalized == stripped or not any(
+        char in normalized for char in _NETLOC_DELIMITERS
+    )
+
+
+def _is_bracketed_host(host: str) -> bool:
+    """Check a ``[...]`` host the way urlsplit does: IPv6 or IPvFuture."""
+    if host.startswith("v"):
+        return _IPV_FUTURE_RE.fullmatch(host) is not None
+
+    # Bracketed hosts are rare; keep ipaddress off the import path
+    import ipaddress
 
     try:
-        result = urlparse(url)
-        # Check for valid scheme (http/https) and network location
-        return all(
-            [
-                result.scheme in ("http", "https"),
-                result.netloc,
-            ]
-        )
-    except (ValueError, AttributeError):
+        return ipaddress.ip_address(host).version == 6
+    except ValueError:
         return False
 
 
-def safe_create_directory(path: Union[str, Path]) -> None:
+def safe_create_directory(path: Union[str, bytes, Path]) -> None:
     """Create a directory and all necessary parent directories.
 
     This is a safe wrapper around os.makedirs that handles existing directories
     gracefully and provides better error messages.
 
     Args:
-        path: Path to the directory to create
+        path: Path to the directory to create, as str, bytes or Path
 
     Raises:
         MarketplaceValidationError: If path is invalid or cannot be created
@@ -102,13 +195,16 @@ def safe_create_directory(path: Union[str, Path]) -> None:
     if not path:
         raise MarketplaceValidationError("Directory path cannot be empty")
 
-    path_obj = Path(path)
+    # Existing directories are the common case; a single stat answers it
+    # without the failing mkdir syscall and exception inside os.makedirs
+    if os.path.isdir(path):
+        return
 
     try:
-        path_obj.mkdir(parents=True, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
     except OSError as e:
         raise MarketplaceValidationError(
-            f"Failed to create directory '{path}': {e}"
+            f"Failed to create directory '{os.fsdecode(path)}': {e}"
         ) from e
 
 
@@ -136,16 +232,23 @@ def format_bytes(byte_count: int) -> str:
     if byte_count < 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    unit_index = 0
-    size = float(byte_count)
-
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
-
-    # Format with 2 decimal places, but strip trailing zeros
-    if unit_index == 0:  # Bytes - no decimal
-        return f"{int(size)} {units[unit_index]}"
+    value: float
+    if type(byte_count) is int:
+        count = value = byte_count
     else:
-        return f"{size:.2f} {units[unit_index]}"
+        # Floats (e.g. total / 2), numpy integers and other numbers: format
+        # their float value, truncating to whole bytes for the unit pick
+        value = float(byte_count)
+        if math.isinf(value):
+            # No whole-byte count to pick a unit from; report it in the top one
+            return f"{value:.2f} {_UNITS[_MAX_UNIT_INDEX]}"
+        count = int(value)
+
+    if count < 1024:
+        return f"{count} B"
+
+    # Each unit is a factor of 2**10, so the highest set bit picks the unit
+    unit_index = min((count.bit_length() - 1) // 10, _MAX_UNIT_INDEX)
+    size = value / (1 << (unit_index * 10))
+
+    return f"{size:.2f} {_UNITS[unit_index]}"
@@ -1,5 +1,9 @@
 """Test backward compatibility of imports after code reorganization."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 
@@ -107,7 +111,141 @@ def test_all_exports_present() -> None:
         "validate_url",
         "safe_create_directory",
         "format_bytes",
+        "INVALID_FILENAME_CHARS",
+        # Lazy imports
+        "lazy_import",
     }
 
     actual_exports = set(asset_marketplace_core.__all__)
     assert expected_exports == actual_exports, f"Missing or extra exports: {expected_exports.symmetric_difference(actual_exports)}"
+
+
+def test_package_import_is_lazy() -> None:
+    """Test that importing the package does not import its submodules."""
+    # Only the private helper that builds the lazy hooks is loaded eagerly
+    code = (
+        "import sys, asset_marketplace_core\n"
+        "loaded = [m for m in sys.modules if m.startswith('asset_marketplace_core.')]\n"
+        "loaded.remove('asset_marketplace_core._lazy')\n"
+        "assert not loaded, loaded\n"
+        "asset_marketplace_core.sanitize_filename\n"
+        "assert 'asset_marketplace_core.client' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attribute_access() -> None:
+    """Test that lazily resolved names are cached and unknown names raise."""
+    import asset_marketplace_core
+    from asset_marketplace_core.models.base import BaseAsset
+
+    assert asset_marketplace_core.BaseAsset is BaseAsset
+    assert "BaseAsset" in vars(asset_marketplace_core)
+    assert set(asset_marketplace_core.__all__) <= set(dir(asset_marketplace_core))
+
+    with pytest.raises(AttributeError):
+        asset_marketplace_core.NotARealName  # noqa: B018
+
+
+def test_submodules_reachable_as_attributes() -> None:
+    """Test that submodules resolve as attributes after a bare import."""
+    code = (
+        "import asset_marketplace_core as pkg\n"
+        "for name in ('auth', 'client', 'exceptions', 'models', 'utils'):\n"
+        "    assert name in dir(pkg), name\n"
+        "    module = getattr(pkg, name)\n"
+        "    assert module.__name__ == 'asset_marketplace_core.' + name\n"
+        "assert pkg.utils.format_bytes(1024) == '1.00 KB'\n"
+        "assert pkg.exceptions.MarketplaceError is pkg.MarketplaceError\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_subpackage_submodules_reachable_as_attributes() -> None:
+    """Test that subpackage submodules resolve as attributes after import."""
+    code = (
+        "import asset_marketplace_core.auth\n"
+        "import asset_marketplace_core.client\n"
+        "import asset_marketplace_core.models\n"
+        "from asset_marketplace_core import auth, client, models\n"
+        "assert models.base.BaseAsset is models.BaseAsset\n"
+        "assert models.result.DownloadResult is models.DownloadResult\n"
+        "assert client.async_.AsyncMarketplaceClient is client.AsyncMarketplaceClient\n"
+        "assert auth.async_.AsyncAuthProvider is auth.AsyncAuthProvider\n"
+        "assert 'base' in dir(models) and 'async_' in dir(client)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_sync_import_skips_async_modules() -> None:
+    """Test that importing a sync class does not import its async twin."""
+    code = (
+        "import sys\n"
+        "from asset_marketplace_core import MarketplaceClient\n"
+        "assert 'asset_marketplace_core.client.async_' not in sys.modules\n"
+        "assert 'asset_marketplace_core.auth.async_' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_legacy_progress_module_paths() -> None:
+    """Test that the pre-merge progress module paths still resolve."""
+    from asset_marketplace_core.models.async_progress import AsyncProgressCallback
+    from asset_marketplace_core.models.progress import (
+        AsyncProgressCallback as MergedAsyncProgressCallback,
+    )
+    from asset_marketplace_core.models.progress import (
+        ProgressCallback as MergedProgressCallback,
+    )
+    from asset_marketplace_core.models.sync_progress import ProgressCallback
+
+    assert ProgressCallback is MergedProgressCallback
+    assert AsyncProgressCallback is MergedAsyncProgressCallback
+
+
+def test_no_flat_module_shadows_subpackage() -> None:
+    """Test that no legacy flat module sits next to a same-named subpackage."""
+    import asset_marketplace_core
+
+    package_dir = Path(asset_marketplace_core.__file__).parent
+    for entry in package_dir.iterdir():
+        if (entry / "__init__.py").is_file():
+            assert not (package_dir / f"{entry.name}.py").exists(), entry.name
+
+
+def test_exception_classes_are_regular_subclasses() -> None:
+    """Test table-generated exceptions behave like hand-written classes."""
+    import pickle
+
+    from asset_marketplace_core import exceptions
+
+    for name in exceptions.__all__:
+        cls = getattr(exceptions, name)
+        assert issubclass(cls, exceptions.MarketplaceError)
+        assert cls.__module__ == "asset_marketplace_core.exceptions"
+        assert cls.__qualname__ == name
+        assert cls.__doc__
+
+        error = pickle.loads(pickle.dumps(cls("boom")))
+        assert type(error) is cls
+        assert str(error) == "boom"
+
+
+def test_exception_stub_matches_runtime() -> None:
+    """Test exceptions.pyi declares exactly the generated classes."""
+    import ast
+
+    from asset_marketplace_core import exceptions
+
+    stub = Path(exceptions.__file__).with_suffix(".pyi")
+    tree = ast.parse(stub.read_text(encoding="utf-8"))
+    declared = {
+        node.name: [base.id for base in node.bases if isinstance(base, ast.Name)]
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+    }
+
+    assert sorted(declared) == sorted(exceptions.__all__)
+    for name, bases in declared.items():
+        runtime_bases = getattr(exceptions, name).__bases__
+        assert bases == [base.__name__ for base in runtime_bases], name
@@ -0,0 +1,99 @@
+"""Tests for the lazy_import and attach helpers."""
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+from asset_marketplace_core import lazy_import
+from asset_marketplace_core._lazy import attach
+
+
+def test_lazy_import_defers_module_execution() -> None:
+    """Test that a lazily imported module loads on first attribute access."""
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_import("colorsys")
+    try:
+        assert type(colorsys).__name__ == "_LazyModule"
+        assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert lazy_import("colorsys") is colorsys
+    finally:
+        sys.modules.pop("colorsys", None)
+
+
+def test_lazy_import_dotted_attribute() -> None:
+    """Test that dotted names resolve to attributes or submodules on use."""
+    sqrt = lazy_import("math.sqrt")
+    assert "unresolved" in repr(sqrt)
+    assert sqrt(9.0) == 3.0
+    assert repr(sqrt) == "<lazy 'math.sqrt' (resolved)>"
+
+    path = lazy_import("os.path")
+    assert path.join("a", "b") == f"a{path.sep}b"
+
+
+def test_lazy_import_proxy_copy_and_pickle() -> None:
+    """Test that dotted-name proxies survive copy and pickle."""
+    sqrt = lazy_import("math.sqrt")
+    for clone in (
+        copy.copy(sqrt),
+        copy.deepcopy(sqrt),
+        pickle.loads(pickle.dumps(sqrt)),
+    ):
+        assert clone(16.0) == 4.0
+
+
+def test_lazy_import_proxy_forwards_attributes() -> None:
+    """Test that proxies forward dunder and private names to the target."""
+    import json.decoder
+
+    decoder = lazy_import("json.decoder")
+    assert decoder.__name__ == "json.decoder"
+    assert decoder.__doc__ == json.decoder.__doc__
+    assert decoder._CONSTANTS is json.decoder._CONSTANTS
+    assert lazy_import("math.sqrt").__module__ == "math"
+
+
+def test_lazy_import_missing_module() -> None:
+    """Test that missing top-level packages fail immediately."""
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("not_a_real_module_for_tests")
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("not_a_real_module_for_tests.attr")
+
+
+def test_lazy_import_namespace_package(tmp_path, monkeypatch) -> None:
+    """Test that namespace packages (no loader) import instead of failing."""
+    (tmp_path / "lazy_ns_pkg").mkdir()
+    (tmp_path / "lazy_ns_pkg" / "mod.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        ns = lazy_import("lazy_ns_pkg")
+        assert ns.__name__ == "lazy_ns_pkg"
+        assert lazy_import("lazy_ns_pkg.mod").VALUE == 1
+    finally:
+        sys.modules.pop("lazy_ns_pkg.mod", None)
+        sys.modules.pop("lazy_ns_pkg", None)
+
+
+def test_lazy_import_missing_attribute() -> None:
+    """Test that unknown attributes fail on first use."""
+    missing = lazy_import("math.not_a_real_function")
+    with pytest.raises(ImportError):
+        missing()
+
+
+def test_attach_resolves_names_and_submodules() -> None:
+    """Test that attach() hooks load, cache and list lazy names."""
+    import asset_marketplace_core.models as models
+
+    getattr_, dir_ = attach(models.__name__, {"BaseAsset": ".base"}, {"result"})
+    from asset_marketplace_core.models.base import BaseAsset
+
+    assert getattr_("BaseAsset") is BaseAsset
+    assert getattr_("result").__name__ == "asset_marketplace_core.models.result"
+    assert {"BaseAsset", "result"} <= set(dir_())
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        getattr_("missing")
@@ -1,10 +1,22 @@
 """Tests for data models."""
 
+import sys
+import weakref
+from dataclasses import asdict, astuple, dataclass, fields
 from datetime import datetime
+from typing import Any, Dict, List, Optional, get_type_hints
 
 import pytest
 
-from asset_marketplace_core import BaseAsset, BaseCollection, DownloadResult
+from asset_marketplace_core import (
+    AsyncProgressCallback,
+    BaseAsset,
+    BaseCollection,
+    DownloadResult,
+    EndpointConfig,
+    ProgressCallback,
+)
+from asset_marketplace_core._compat import DATACLASS_SLOTS
 
 
 def test_base_asset_creation() -> None:
@@ -52,6 +64,14 @@ def test_base_collection_with_assets() -> None:
     assert collection.total_count == 2
 
 
+def test_base_collection_len_and_bool_ignore_total_count() -> None:
+    """Test len() and truthiness reflect the assets held, not total_count."""
+    page = BaseCollection(assets=[BaseAsset(uid="1", title="Asset 1")], total_count=50)
+    assert len(page) == 1
+    assert page
+    assert not BaseCollection(total_count=50)
+
+
 def test_base_collection_filter() -> None:
     """Test BaseCollection filter method."""
     assets = [
@@ -66,6 +86,23 @@ def test_base_collection_filter() -> None:
     assert all("Python" in a.title for a in filtered.assets)
 
 
+def test_base_collection_filter_many() -> None:
+    """Test BaseCollection filter_many applies all predicates."""
+    assets = [
+        BaseAsset(uid="1", title="Python Asset"),
+        BaseAsset(uid="2", title="Java Asset"),
+        BaseAsset(uid="3", title="Python Tool"),
+    ]
+    collection = BaseCollection(assets=assets)
+
+    filtered = collection.filter_many(
+        lambda a: "Python" in a.title, lambda a: a.title.endswith("Tool")
+    )
+    assert [a.uid for a in filtered.assets] == ["3"]
+    assert filtered.total_count == 1
+    assert len(collection.filter_many()) == 3
+
+
 def test_base_collection_find_by_uid() -> None:
     """Test BaseCollection find_by_uid method."""
     assets = [
@@ -105,3 +142,168 @@ def test_download_result_failure() -> None:
     assert not result.success
     assert result.error == "Network timeout"
     assert result.files == []
+
+
+def test_base_collection_find_by_uid_duplicates() -> None:
+    """Test find_by_uid returns the first asset when uids repeat."""
+    assets = [
+        BaseAsset(uid="1", title="First"),
+        BaseAsset(uid="1", title="Second"),
+    ]
+    collection = BaseCollection(assets=assets)
+
+    found = collection.find_by_uid("1")
+    assert found is not None
+    assert found.title == "First"
+
+
+def test_base_collection_invalidate_index() -> None:
+    """Test find_by_uid sees in-place mutations after invalidate_index."""
+    collection = BaseCollection(assets=[BaseAsset(uid="1", title="Asset 1")])
+    assert collection.find_by_uid("2") is None
+
+    collection.assets.append(BaseAsset(uid="2", title="Asset 2"))
+    collection.invalidate_index()
+
+    found = collection.find_by_uid("2")
+    assert found is not None
+    assert found.title == "Asset 2"
+    assert collection == BaseCollection(assets=collection.assets)
+
+
+def test_base_collection_index_tracks_rebinding() -> None:
+    """Test find_by_uid follows assets being rebound or resized."""
+    collection = BaseCollection(assets=[BaseAsset(uid="1", title="Asset 1")])
+    assert collection.find_by_uid("1") is not None
+
+    collection.assets = [BaseAsset(uid="2", title="Asset 2")]
+    assert collection.find_by_uid("1") is None
+    found = collection.find_by_uid("2")
+    assert found is not None
+    assert found.title == "Asset 2"
+
+    collection.assets.append(BaseAsset(uid="3", title="Asset 3"))
+    assert collection.find_by_uid("3") is not None
+
+    # Same-length replacement is only seen after invalidate_index()
+    collection.assets[0] = BaseAsset(uid="4", title="Asset 4")
+    collection.invalidate_index()
+    assert collection.find_by_uid("2") is None
+    assert collection.find_by_uid("4") is not None
+
+
+def test_base_collection_index_not_serialized() -> None:
+    """Test the uid index stays out of dataclass fields and asdict()."""
+    collection = BaseCollection(assets=[BaseAsset(uid="1", title="Asset 1")])
+    collection.find_by_uid("1")
+
+    assert [f.name for f in fields(collection)] == ["assets", "total_count"]
+    assert set(asdict(collection)) == {"assets", "total_count"}
+    assert astuple(collection)[1] is None
+    assert "_uid_index" not in repr(collection)
+
+
+def test_model_type_hints_resolve() -> None:
+    """Test get_type_hints() resolves model fields without extra namespaces."""
+    hints = get_type_hints(BaseAsset)
+    assert hints["created_at"] == Optional[datetime]
+    assert hints["raw_data"] == Dict[str, Any]
+    assert get_type_hints(BaseCollection)["assets"] == List[BaseAsset]
+    assert get_type_hints(DownloadResult)["files"] == List[str]
+    assert get_type_hints(EndpointConfig)["base_url"] is str
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="slots need Python 3.11+")
+def test_models_are_slotted() -> None:
+    """Test models do not carry a per-instance __dict__."""
+    assert not hasattr(BaseAsset(uid="1", title="Asset"), "__dict__")
+    assert not hasattr(BaseCollection(), "__dict__")
+    assert not hasattr(DownloadResult(success=True, asset_uid="1"), "__dict__")
+
+
+def test_models_support_weakrefs() -> None:
+    """Test model instances can be weakly referenced."""
+    for instance in (
+        BaseAsset(uid="1", title="Asset"),
+        BaseCollection(),
+        DownloadResult(success=True, asset_uid="1"),
+        EndpointConfig(base_url="https://api.example.com"),
+    ):
+        assert weakref.ref(instance)() is instance
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="typing.Protocol needs 3.8+")
+def test_progress_callbacks_are_structural() -> None:
+    """Test callbacks satisfy the progress protocols without subclassing."""
+
+    class SyncProgress:
+        def on_start(self, total: Optional[int]) -> None: ...
+        def on_progress(self, current: int, total: Optional[int]) -> None: ...
+        def on_complete(self) -> None: ...
+        def on_error(self, error: Exception) -> None: ...
+
+    class AsyncProgress:
+        async def on_start(self, total: Optional[int]) -> None: ...
+        async def on_progress(self, current: int, total: Optional[int]) -> None: ...
+        async def on_complete(self) -> None: ...
+        async def on_error(self, error: Exception) -> None: ...
+
+    assert isinstance(SyncProgress(), ProgressCallback)
+    assert isinstance(AsyncProgress(), AsyncProgressCallback)
+    assert not isinstance(object(), ProgressCallback)
+
+
+def test_download_result_constructors() -> None:
+    """Test DownloadResult.ok and DownloadResult.fail match the full form."""
+    ok = DownloadResult.ok("test-123", ["/tmp/file.zip"], {"size": 1024})
+    assert ok == DownloadResult(
+        success=True,
+        asset_uid="test-123",
+        files=["/tmp/file.zip"],
+        metadata={"size": 1024},
+    )
+    assert DownloadResult.ok("test-123", []).metadata == {}
+
+    failed = DownloadResult.fail("test-123", "Network timeout")
+    assert failed == DownloadResult(
+        success=False, asset_uid="test-123", error="Network timeout"
+    )
+    assert failed.files is not DownloadResult.fail("other", "err").files
+
+
+def test_download_result_constructors_on_subclass() -> None:
+    """Test DownloadResult.ok and DownloadResult.fail build the subclass."""
+
+    @dataclass
+    class PlatformResult(DownloadResult):
+        checksum: str = ""
+
+    ok: PlatformResult = PlatformResult.ok("test-123", ["/tmp/file.zip"])
+    failed: PlatformResult = PlatformResult.fail("test-123", "Network timeout")
+    assert type(ok) is PlatformResult and ok.checksum == ""
+    assert type(failed) is PlatformResult and failed.error == "Network timeout"
+
+
+@pytest.mark.skipif(
+    sys.version_info[:2] == (3, 12), reason="interned strings are immortal on 3.12"
+)
+def test_base_asset_uid_interned() -> None:
+    """Test equal uids from separate sources share one string object."""
+    first = BaseAsset(uid="".join(["asset-", "42"]), title="Page 1")
+    second = BaseAsset(uid="".join(["asset-", "42"]), title="Page 2")
+    assert first.uid is second.uid
+
+
+def test_base_asset_subclass_post_init() -> None:
+    """Test the documented way for subclasses to extend __post_init__."""
+
+    @dataclass(**DATACLASS_SLOTS)
+    class PlatformAsset(BaseAsset):
+        slug: str = ""
+
+        def __post_init__(self) -> None:
+            BaseAsset.__post_init__(self)
+            self.slug = self.title.lower().replace(" ", "-")
+
+    asset = PlatformAsset(uid="1", title="Epic Asset")
+    assert asset.slug == "epic-asset"
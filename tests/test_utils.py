@@ -1,11 +1,15 @@
 """Tests for utility functions."""
 
+import os
 import tempfile
+from fractions import Fraction
 from pathlib import Path
+from typing import get_type_hints
 
 import pytest
 
 from asset_marketplace_core import (
+    INVALID_FILENAME_CHARS,
     MarketplaceValidationError,
     format_bytes,
     safe_create_directory,
@@ -39,6 +43,19 @@ def test_sanitize_filename_only_invalid() -> None:
         sanitize_filename("///***???")
 
 
+def test_invalid_filename_chars() -> None:
+    """Test the public invalid-character set matches what is stripped."""
+    assert INVALID_FILENAME_CHARS == frozenset('/\\:*?"<>|')
+    for char in INVALID_FILENAME_CHARS:
+        assert sanitize_filename(f"a{char}b") == "ab"
+
+
+def test_cached_utils_keep_typed_signatures() -> None:
+    """Test that memoized utilities expose their annotated signatures."""
+    assert get_type_hints(sanitize_filename) == {"filename": str, "return": str}
+    assert get_type_hints(validate_url) == {"url": str, "return": bool}
+
+
 def test_validate_url_valid() -> None:
     """Test validating valid URLs."""
     assert validate_url("https://example.com")
@@ -55,6 +72,57 @@ def test_validate_url_invalid() -> None:
     assert not validate_url("javascript:alert('xss')")
 
 
+def test_validate_url_scheme_case_insensitive() -> None:
+    """Test that URL schemes are matched case-insensitively."""
+    assert validate_url("HTTPS://example.com")
+    assert validate_url("Http://example.com/path")
+
+
+def test_validate_url_netloc() -> None:
+    """Test that URLs need a well-formed network location."""
+    assert validate_url("http://[::1]:8080/path")
+    assert not validate_url("https://")
+    assert not validate_url("http:///path/only")
+    assert not validate_url("http://[::1")
+    assert not validate_url("https://exa mple.com")
+    assert not validate_url("https://exa\tmple.com")
+    # Characters that NFKC-normalize into URL delimiters (CVE-2019-9636)
+    assert not validate_url("https://evil.com\uff03@good.com")
+    assert not validate_url("https://exa\uff0fmple.com")
+    assert not validate_url("https://ex\u2100ample.com")
+    assert not validate_url("https://x\uff20evil.com")
+    assert validate_url("https://b\u00fccher.example/")
+
+
+def test_validate_url_bracketed_host() -> None:
+    """Test that bracketed hosts must be IPv6 (or IPvFuture) literals."""
+    assert validate_url("http://[::1]/")
+    assert validate_url("http://user@[2001:db8::1]:443")
+    assert validate_url("http://[v1.fe]/")
+    assert not validate_url("http://[a]")
+    assert not validate_url("http://[127.0.0.1]")
+    assert not validate_url("http://[::1][::2]")
+    assert not validate_url("http://a[::1]")
+    assert not validate_url("http://[::1]a")
+    assert not validate_url("http://[::1]:80@evil.com")
+
+
+def test_validate_url_surrounding_whitespace() -> None:
+    """Test that surrounding whitespace and control characters are ignored."""
+    assert validate_url("https://example.com\n")
+    assert validate_url("  https://example.com/path")
+    assert validate_url("\thttps://example.com/\r\n")
+    assert not validate_url(" \n")
+
+
+def test_validate_url_non_str() -> None:
+    """Test that non-string values are invalid rather than raising."""
+    assert not validate_url(None)  # type: ignore[arg-type]
+    assert not validate_url(123)  # type: ignore[arg-type]
+    assert not validate_url(b"https://example.com")  # type: ignore[arg-type]
+    assert not validate_url(["https://example.com"])  # type: ignore[arg-type]
+
+
 def test_safe_create_directory() -> None:
     """Test creating directory safely."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -72,6 +140,23 @@ def test_safe_create_directory_exists() -> None:
         safe_create_directory(tmpdir)
 
 
+def test_safe_create_directory_bytes() -> None:
+    """Test creating directory from a bytes path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_dir = Path(tmpdir) / "from_bytes"
+        safe_create_directory(os.fsencode(test_dir))
+        assert test_dir.is_dir()
+
+
+def test_safe_create_directory_file_in_the_way() -> None:
+    """Test creating directory where a file already exists raises error."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = Path(tmpdir) / "not_a_dir"
+        file_path.write_text("")
+        with pytest.raises(MarketplaceValidationError):
+            safe_create_directory(file_path)
+
+
 def test_safe_create_directory_empty() -> None:
     """Test creating directory with empty path raises error."""
     with pytest.raises(MarketplaceValidationError):
@@ -82,6 +167,7 @@ def test_format_bytes() -> None:
     """Test formatting byte counts."""
     assert format_bytes(0) == "0 B"
     assert format_bytes(512) == "512 B"
+    assert format_bytes(1023) == "1023 B"
     assert format_bytes(1024) == "1.00 KB"
     assert format_bytes(1536) == "1.50 KB"
     assert format_bytes(1048576) == "1.00 MB"
@@ -89,6 +175,35 @@ def test_format_bytes() -> None:
     assert format_bytes(5368709120) == "5.00 GB"
 
 
+def test_format_bytes_rounding() -> None:
+    """Test rounding and unit boundaries of formatted byte counts."""
+    # 1152 B is exactly 1.125 KB; ties round half to even
+    assert format_bytes(1152) == "1.12 KB"
+    assert format_bytes(1040) == "1.02 KB"
+    # One byte short of the next unit stays in the smaller unit
+    assert format_bytes(1048575) == "1024.00 KB"
+    # PB is the largest unit
+    assert format_bytes(1024**6) == "1024.00 PB"
+
+
+def test_format_bytes_non_int() -> None:
+    """Test formatting floats and other non-int numbers."""
+    assert format_bytes(1536.0) == "1.50 KB"  # type: ignore[arg-type]
+    assert format_bytes(512.7) == "512 B"  # type: ignore[arg-type]
+    assert format_bytes(1023.9) == "1023 B"  # type: ignore[arg-type]
+    assert format_bytes(Fraction(3 * 1024**3, 2)) == "1.50 GB"  # type: ignore[arg-type]
+    assert format_bytes(-0.5) == "0 B"  # type: ignore[arg-type]
+
+
 def test_format_bytes_negative() -> None:
     """Test formatting negative byte count."""
     assert format_bytes(-100) == "0 B"
+    assert format_bytes(-1) == "0 B"
+
+
+def test_format_bytes_non_finite() -> None:
+    """Test infinite counts format in PB as before and NaN is rejected."""
+    assert format_bytes(float("inf")) == "inf PB"
+    assert format_bytes(float("-inf")) == "0 B"
+    with pytest.raises(ValueError):
+        format_bytes(float("nan"))